@@ -11,8 +11,54 @@ class ActionError(Exception):
 
 re_action_params = re.compile(r"([\w\.]+)(\(.*?\))")
 
+IMMUTABLE_TYPES = (str, int, float, bool, type(None))
+MAX_CACHED_ACTIONS = 1024
+
+_action_cache: dict[str, tuple[str, tuple[Any, ...]]] = {}
+
+
+def _is_immutable(value: object) -> bool:
+    """Check if a parsed parameter may be safely shared between calls.
+
+    Args:
+        value (object): A value returned from ``ast.literal_eval``.
+
+    Returns:
+        bool: True if the value (and anything it contains) is immutable.
+    """
+    if isinstance(value, tuple):
+        return all(_is_immutable(item) for item in value)
+    return isinstance(value, IMMUTABLE_TYPES)
+
 
 def parse(action: str) -> tuple[str, tuple[Any, ...]]:
+    """Parse an action string in to a name and parameters.
+
+    Results are cached, as the same action strings are dispatched on every key press
+    and click. Actions with mutable parameters (lists, dicts, sets) are parsed on
+    every call, so a handler that modifies its arguments can't affect later calls.
+
+    Args:
+        action (str): An action string, e.g. "view.toggle('sidebar')".
+
+    Raises:
+        ActionError: If the parameters could not be parsed.
+
+    Returns:
+        tuple[str, tuple[Any, ...]]: The action name and a tuple of parameters.
+    """
+    try:
+        return _action_cache[action]
+    except KeyError:
+        pass
+    result = _parse(action)
+    _action_name, action_params = result
+    if _is_immutable(action_params) and len(_action_cache) < MAX_CACHED_ACTIONS:
+        _action_cache[action] = result
+    return result
+
+
+def _parse(action: str) -> tuple[str, tuple[Any, ...]]:
     params_match = re_action_params.match(action)
     if params_match is not None:
         action_name, action_params_str = params_match.groups()
@@ -11,7 +11,6 @@ import rich.repr
 from rich.screen import Screen
 from rich.console import Console, RenderableType
 from rich.measure import Measurement
-from rich.traceback import Traceback
 
 from . import events
 from . import actions
@@ -229,9 +228,8 @@ class App(MessagePump):
         elif widget.can_focus:
             if self.focused is not None:
                 await self.focused.post_message(events.Blur(self))
-            if widget is not None and self.focused != widget:
-                self.focused = widget
-                await widget.post_message(events.Focus(self))
+            self.focused = widget
+            await widget.post_message(events.Focus(self))
 
     async def set_mouse_over(self, widget: Widget | None) -> None:
         if widget is None:
@@ -245,8 +243,7 @@ class App(MessagePump):
                 try:
                     if self.mouse_over is not None:
                         await self.mouse_over.forward_event(events.Leave(self))
-                    if widget is not None:
-                        await widget.forward_event(events.Enter(self))
+                    await widget.forward_event(events.Enter(self))
                 finally:
                     self.mouse_over = widget
 
@@ -275,6 +272,8 @@ class App(MessagePump):
         """
 
         if not renderables:
+            from rich.traceback import Traceback
+
             renderables = (
                 Traceback(show_locals=True, width=None, locals_max_length=5),
             )
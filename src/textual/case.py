@@ -1,13 +1,17 @@
+from functools import lru_cache
 import re
 
 from typing import Match, Pattern
 
 
+@lru_cache(maxsize=1024)
 def camel_to_snake(
     name: str, _re_snake: Pattern[str] = re.compile("[a-z][A-Z]")
 ) -> str:
     """Convert name from CamelCase to snake_case.
 
+    Results are cached, as this is called to name every message.
+
     Args:
         name (str): A symbol name, such as a class name.
 
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod, abstractmethod
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
 from itertools import chain
 from operator import itemgetter
 import sys
 
-from typing import Iterable, Iterator, NamedTuple, TYPE_CHECKING
+from typing import Iterable, Iterator, KeysView, NamedTuple, TYPE_CHECKING
 from rich import segment
 
 import rich.repr
@@ -93,6 +94,7 @@ class Layout(ABC):
         self.height = 0
         self.regions: dict[Widget, tuple[Region, Region]] = {}
         self._cuts: list[list[int]] | None = None
+        self._layers: tuple[tuple[Widget, Region, Region], ...] | None = None
         self._require_update: bool = True
         self.background = ""
 
@@ -109,6 +111,7 @@ class Layout(ABC):
 
     def reset(self) -> None:
         self._cuts = None
+        self._layers = None
 
     def reflow(self, view: View, size: Size) -> ReflowResult:
         self.reset()
@@ -121,12 +124,15 @@ class Layout(ABC):
 
         self._require_update = False
 
-        old_widgets = set() if self.map is None else set(self.map.keys())
-        new_widgets = set(map.keys())
+        # Key views support set operations, so there is no need to copy them to sets
+        old_widgets: KeysView[Widget] = (
+            {}.keys() if self.map is None else self.map.keys()
+        )
+        new_widgets = map.keys()
         # Newly visible widgets
-        shown_widgets = new_widgets - old_widgets
+        shown_widgets = set(new_widgets - old_widgets)
         # Newly hidden widgets
-        hidden_widgets = old_widgets - new_widgets
+        hidden_widgets = set(old_widgets - new_widgets)
 
         self._layout_map = map
 
@@ -171,13 +177,32 @@ class Layout(ABC):
     def map(self) -> LayoutMap | None:
         return self._layout_map
 
+    @property
+    def layers(self) -> tuple[tuple[Widget, Region, Region], ...]:
+        """Get widgets and their regions, from top-most to bottom-most.
+
+        The result is cached until the next reflow, as it is used to locate the
+        widget under the mouse for every mouse event.
+
+        Returns:
+            tuple[tuple[Widget, Region, Region], ...]: A tuple of
+                (<widget>, <clipped region>, <region>).
+        """
+        if self._layers is not None:
+            return self._layers
+        if self.map is None:
+            return ()
+        layers = sorted(
+            self.map.widgets.items(), key=lambda item: item[1].order, reverse=True
+        )
+        self._layers = tuple(
+            (widget, region.intersection(clip), region)
+            for widget, (region, _order, clip) in layers
+        )
+        return self._layers
+
     def __iter__(self) -> Iterator[tuple[Widget, Region, Region]]:
-        if self.map is not None:
-            layers = sorted(
-                self.map.widgets.items(), key=lambda item: item[1].order, reverse=True
-            )
-            for widget, (region, order, clip) in layers:
-                yield widget, region.intersection(clip), region
+        return iter(self.layers)
 
     def get_offset(self, widget: Widget) -> Offset:
         """Get the offset of a widget."""
@@ -325,20 +350,23 @@ class Layout(ABC):
 
         # TODO: Provide an option to update the background
         background_style = console.get_style(self.background)
-        background_render = [
-            [_Segment(" " * width, background_style)] for _ in range(height)
-        ]
+        # Lines are never modified, so every row can share the same background line
+        background_render = [[_Segment(" " * width, background_style)]] * height
         # Go through all the renders in reverse order and fill buckets with no render
-        renders = list(self._get_renders(console))
+        renders = self._get_renders(console)
 
         for region, clip, lines in chain(
             renders, [(screen, screen, background_render)]
         ):
             render_region = region.intersection(clip)
+            first_cut, last_cut = render_region.x_extents
             for y, line in zip(render_region.y_range, lines):
 
-                first_cut, last_cut = render_region.x_extents
-                final_cuts = [cut for cut in cuts[y] if (last_cut >= cut >= first_cut)]
+                # Cuts are sorted, so we can slice out those within the region
+                line_cuts = cuts[y]
+                start = bisect_left(line_cuts, first_cut)
+                end = bisect_right(line_cuts, last_cut)
+                final_cuts = line_cuts[start:end]
 
                 if len(final_cuts) == 2:
                     cut_segments = [line]
@@ -198,14 +198,16 @@ class GridLayout(Layout):
         self.require_update()
 
     def set_gap(self, column: int, row: int | None = None) -> None:
-        self.column_gap = column
-        self.row_gap = column if row is None else row
-        self.require_update()
+        gap = (column, column if row is None else row)
+        if gap != (self.column_gap, self.row_gap):
+            self.column_gap, self.row_gap = gap
+            self.require_update()
 
     def set_gutter(self, column: int, row: int | None = None) -> None:
-        self.column_gutter = column
-        self.row_gutter = column if row is None else row
-        self.require_update()
+        gutter = (column, column if row is None else row)
+        if gutter != (self.column_gutter, self.row_gutter):
+            self.column_gutter, self.row_gutter = gutter
+            self.require_update()
 
     def add_widget(self, widget: Widget, area: str | None = None) -> Widget:
         self.widgets[widget] = area
@@ -221,18 +223,22 @@ class GridLayout(Layout):
         self.require_update()
 
     def set_repeat(self, column: bool | None = None, row: bool | None = None) -> None:
-        if column is not None:
-            self.column_repeat = column
-        if row is not None:
-            self.row_repeat = row
-        self.require_update()
+        repeat = (
+            self.column_repeat if column is None else column,
+            self.row_repeat if row is None else row,
+        )
+        if repeat != (self.column_repeat, self.row_repeat):
+            self.column_repeat, self.row_repeat = repeat
+            self.require_update()
 
     def set_align(self, column: GridAlign | None = None, row: GridAlign | None = None):
-        if column is not None:
-            self.column_align = column
-        if row is not None:
-            self.row_align = row
-        self.require_update()
+        align = (
+            self.column_align if column is None else column,
+            self.row_align if row is None else row,
+        )
+        if align != (self.column_align, self.row_align):
+            self.column_align, self.row_align = align
+            self.require_update()
 
     @classmethod
     def _align(
@@ -32,6 +32,16 @@ ReactiveType = TypeVar("ReactiveType")
 class Reactive(Generic[ReactiveType]):
     """Reactive descriptor."""
 
+    __slots__ = [
+        "_default",
+        "layout",
+        "repaint",
+        "_first",
+        "name",
+        "internal_name",
+        "validate_name",
+    ]
+
     def __init__(
         self,
         default: ReactiveType,
@@ -56,6 +66,7 @@ class Reactive(Generic[ReactiveType]):
 
         self.name = name
         self.internal_name = f"__{name}"
+        self.validate_name = f"validate_{name}"
         setattr(owner, self.internal_name, self._default)
 
     def __get__(self, obj: Reactable, obj_type: type[object]) -> ReactiveType:
@@ -65,7 +76,7 @@ class Reactive(Generic[ReactiveType]):
 
         name = self.name
         current_value = getattr(obj, self.internal_name, None)
-        validate_function = getattr(obj, f"validate_{name}", None)
+        validate_function = getattr(obj, self.validate_name, None)
         if callable(validate_function):
             value = validate_function(value)
 
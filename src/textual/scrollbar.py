@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 
 import rich.repr
 from rich.color import Color
@@ -14,6 +15,10 @@ from .message import Message
 from .widget import Reactive, Widget
 
 
+DEFAULT_BACK_COLOR = Color.parse("#555555")
+DEFAULT_BAR_COLOR = Color.parse("bright_magenta")
+
+
 @rich.repr.auto
 class ScrollUp(Message):
     """Message sent when clicking above handle."""
@@ -76,8 +81,8 @@ class ScrollBarRender:
         ascii_only: bool = False,
         thickness: int = 1,
         vertical: bool = True,
-        back_color: Color = Color.parse("#555555"),
-        bar_color: Color = Color.parse("bright_magenta"),
+        back_color: Color = DEFAULT_BACK_COLOR,
+        bar_color: Color = DEFAULT_BAR_COLOR,
     ) -> Segments:
 
         if vertical:
@@ -167,12 +172,29 @@ class ScrollBarRender:
             position=self.position,
             vertical=self.vertical,
             thickness=thickness,
-            back_color=_style.bgcolor or Color.parse("#555555"),
-            bar_color=_style.color or Color.parse("bright_magenta"),
+            back_color=_style.bgcolor or DEFAULT_BACK_COLOR,
+            bar_color=_style.color or DEFAULT_BAR_COLOR,
         )
         yield bar
 
 
+@lru_cache(maxsize=4)
+def _get_scrollbar_style(mouse_over: bool, grabbed: bool) -> Style:
+    """Get the style for a scrollbar, which only depends on its state.
+
+    Args:
+        mouse_over (bool): True if the mouse is over the scrollbar.
+        grabbed (bool): True if the scrollbar is being dragged.
+
+    Returns:
+        Style: Style for the scrollbar.
+    """
+    return Style(
+        bgcolor=DEFAULT_BACK_COLOR if mouse_over else Color.parse("#444444"),
+        color=Color.parse("bright_yellow") if grabbed else DEFAULT_BAR_COLOR,
+    )
+
+
 @rich.repr.auto
 class ScrollBar(Widget):
     def __init__(self, vertical: bool = True, name: str | None = None) -> None:
@@ -192,10 +214,7 @@ class ScrollBar(Widget):
         yield "position", self.position
 
     def render(self) -> RenderableType:
-        style = Style(
-            bgcolor=(Color.parse("#555555" if self.mouse_over else "#444444")),
-            color=Color.parse("bright_yellow" if self.grabbed else "bright_magenta"),
-        )
+        style = _get_scrollbar_style(bool(self.mouse_over), bool(self.grabbed))
         return ScrollBarRender(
             virtual_size=self.virtual_size,
             window_size=self.window_size,
@@ -24,7 +24,9 @@ class Static(Widget):
         renderable = self.renderable
         if self.padding:
             renderable = Padding(renderable, self.padding)
-        return Styled(renderable, self.style)
+        if self.style:
+            renderable = Styled(renderable, self.style)
+        return renderable
 
     async def update(self, renderable: RenderableType) -> None:
         self.renderable = renderable
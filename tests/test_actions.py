@@ -0,0 +1,30 @@
+import pytest
+
+from textual.actions import ActionError, parse
+
+
+def test_parse():
+    assert parse("quit") == ("quit", ())
+    assert parse("view.toggle") == ("view.toggle", ())
+    assert parse("view.toggle('sidebar')") == ("view.toggle", ("sidebar",))
+    assert parse("app.press('a', 2)") == ("app.press", ("a", 2))
+
+
+def test_parse_mutable_params_not_shared():
+    _action_name, (items,) = parse("foo([1, 2])")
+    items.append(3)
+    assert parse("foo([1, 2])") == ("foo", ([1, 2],))
+
+    _action_name, (mapping,) = parse("foo({'a': 1})")
+    mapping["b"] = 2
+    assert parse("foo({'a': 1})") == ("foo", ({"a": 1},))
+
+
+def test_parse_repeated():
+    assert parse("app.press('a', 2)") == ("app.press", ("a", 2))
+    assert parse("app.press('a', 2)") == ("app.press", ("a", 2))
+
+
+def test_parse_error():
+    with pytest.raises(ActionError):
+        parse("foo(bar)")
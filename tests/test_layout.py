@@ -0,0 +1,27 @@
+import pytest
+
+from textual.geometry import Size
+from textual.layout import NoWidget
+from textual.layouts.dock import Dock, DockLayout
+from textual.view import View
+from textual.widget import Widget
+
+
+def test_layers_invalidated():
+    first = Widget(name="first")
+    second = Widget(name="second")
+    layout = DockLayout([Dock("top", (first,), 0)])
+
+    layout.reflow(View(layout=layout), Size(10, 10))
+    assert isinstance(layout.layers, tuple)
+    assert layout.get_widget_at(0, 0)[0] is first
+
+    # Reflow resets the cached layers (a new view, as views cache their arrangement)
+    layout.docks[:] = [Dock("top", (second,), 0)]
+    layout.reflow(View(layout=layout), Size(10, 10))
+    assert layout.get_widget_at(0, 0)[0] is second
+
+    # require_update discards the map, and the layers with it
+    layout.require_update()
+    with pytest.raises(NoWidget):
+        layout.get_widget_at(0, 0)